@@ -1,9 +1,149 @@
 import inspect
-from typing import Callable, Set
+from itertools import chain
+from types import FunctionType
+from typing import AbstractSet, Callable
+from weakref import WeakKeyDictionary
+
+_POSITIONAL_ONLY = inspect.Parameter.POSITIONAL_ONLY
+_POSITIONAL_OR_KEYWORD = inspect.Parameter.POSITIONAL_OR_KEYWORD
+_VAR_POSITIONAL = inspect.Parameter.VAR_POSITIONAL
+_KEYWORD_ONLY = inspect.Parameter.KEYWORD_ONLY
+_VAR_KEYWORD = inspect.Parameter.VAR_KEYWORD
+_EMPTY = inspect.Parameter.empty
+# The kinds of delegatee parameters that are added to the delegator.
+_DELEGATED_KINDS = frozenset((_POSITIONAL_OR_KEYWORD, _KEYWORD_ONLY, _VAR_KEYWORD))
+# Parameters are ordered by kind and then by whether they specify a default value, so there are two buckets per kind.
+_NUM_BUCKETS = 2 * len(type(_KEYWORD_ONLY))
+# The shared default for delegate's ignore parameter.
+_NO_IGNORE: AbstractSet[str] = frozenset()
+
+# Signatures of delegatees that have already been introspected, so that reusing a delegatee across many ``@delegate``
+# sites only walks its parameters once. Each signature is stored with the function state it was built from. Entries
+# hold strong references to the function's defaults and annotations, so a function whose defaults or annotations refer
+# back to it (other than directly, which is never cached) is kept alive for as long as that reference exists.
+_SIGNATURE_CACHE: "WeakKeyDictionary[FunctionType, tuple]" = WeakKeyDictionary()
+
+
+def _function_signature(fn: FunctionType) -> inspect.Signature:
+    """
+    Build the signature of a plain Python function directly from its code object, defaults and annotations.
+
+    This gives the same result as ``inspect.signature`` for functions without any attributes of their own (such as
+    ``__wrapped__``, ``__signature__`` or the ``_partialmethod`` set by ``functools.partialmethod``), without going
+    through its generic handling of other kinds of callables.
+    """
+    code = fn.__code__
+    names = code.co_varnames
+    pos_count = code.co_argcount
+    posonly_count = code.co_posonlyargcount
+    kwonly_count = code.co_kwonlyargcount
+    defaults = fn.__defaults__ or ()
+    kwdefaults = fn.__kwdefaults__ or {}
+    annotations = fn.__annotations__
+    Parameter = inspect.Parameter
+
+    params = []
+    non_default_count = pos_count - len(defaults)
+    for i, name in enumerate(names[:pos_count]):
+        kind = _POSITIONAL_ONLY if i < posonly_count else _POSITIONAL_OR_KEYWORD
+        default = defaults[i - non_default_count] if i >= non_default_count else _EMPTY
+        params.append(Parameter(name, kind, default=default, annotation=annotations.get(name, _EMPTY)))
+    index = pos_count + kwonly_count
+    if code.co_flags & inspect.CO_VARARGS:
+        name = names[index]
+        params.append(Parameter(name, _VAR_POSITIONAL, annotation=annotations.get(name, _EMPTY)))
+    for name in names[pos_count:pos_count + kwonly_count]:
+        default = kwdefaults.get(name, _EMPTY)
+        params.append(Parameter(name, _KEYWORD_ONLY, default=default, annotation=annotations.get(name, _EMPTY)))
+    if code.co_flags & inspect.CO_VARKEYWORDS:
+        if code.co_flags & inspect.CO_VARARGS:
+            index += 1
+        name = names[index]
+        params.append(Parameter(name, _VAR_KEYWORD, annotation=annotations.get(name, _EMPTY)))
+    return inspect.Signature(params, return_annotation=annotations.get("return", _EMPTY), __validate_parameters__=False)
+
+
+def _is_plain_function(fn: Callable) -> bool:
+    """
+    Check whether a callable is a Python function whose signature can be built by ``_function_signature``.
+    """
+    return type(fn) is FunctionType and not fn.__dict__
+
+
+def _signature(fn: Callable) -> inspect.Signature:
+    """
+    Return the signature of a callable, building it directly from the code object for plain functions.
+    """
+    if _is_plain_function(fn):
+        return _function_signature(fn)
+    return inspect.signature(fn)
+
+
+def _function_state(fn: FunctionType) -> tuple:
+    """
+    Return the parts of a plain function that its signature is built from.
+    """
+    kwdefaults = tuple((fn.__kwdefaults__ or {}).items())
+    return fn.__code__, fn.__defaults__, kwdefaults, tuple(fn.__annotations__.items())
+
+
+def _same_items(a, b) -> bool:
+    """
+    Check whether two sequences of (name, value) pairs have equal names and identical values.
+    """
+    return len(a) == len(b) and all(x[0] == y[0] and x[1] is y[1] for x, y in zip(a, b))
+
+
+def _cached_signature(fn: Callable) -> inspect.Signature:
+    """
+    Return the signature of a callable, caching it for plain functions.
+
+    A cached signature is only reused while the function's code, defaults, keyword-only defaults and annotations are
+    unchanged, since any of them may be replaced or mutated after the fact.
+    """
+    if not _is_plain_function(fn):
+        return inspect.signature(fn)
+    state = _function_state(fn)
+    cached = _SIGNATURE_CACHE.get(fn)
+    if cached is not None:
+        cached_state, sig = cached
+        if (
+            cached_state[0] is state[0]
+            and cached_state[1] is state[1]
+            and _same_items(cached_state[2], state[2])
+            and _same_items(cached_state[3], state[3])
+        ):
+            return sig
+    sig = _function_signature(fn)
+    # A function among its own defaults or annotations would keep its cache entry alive, so it is not cached.
+    defaults, kwdefaults, annotations = state[1:]
+    values = chain(defaults or (), (value for _, value in kwdefaults), (value for _, value in annotations))
+    if not any(value is fn for value in values):
+        _SIGNATURE_CACHE[fn] = state, sig
+    return sig
+
+
+def _partition(params) -> list:
+    """
+    Partition parameters into buckets indexed by (kind, has default), preserving their relative order within each
+    bucket. The parameter kinds are the contiguous integers from 0, so concatenating the buckets sorts the parameters.
+    """
+    buckets = [[] for _ in range(_NUM_BUCKETS)]
+    for param in params:
+        buckets[2 * param.kind + (param.default is not _EMPTY)].append(param)
+    return buckets
+
+
+def _replace_parameters(sig: inspect.Signature, parameters, validate: bool = False) -> inspect.Signature:
+    """
+    Like ``sig.replace(parameters=parameters)``, but skips the validation of the new parameters unless validate is True.
+    The caller is responsible for passing uniquely named parameters in a valid order.
+    """
+    return type(sig)(parameters, return_annotation=sig.return_annotation, __validate_parameters__=validate)
 
 
 def delegate(
-    delegatee: Callable, *, kwonly: bool = True, delegate_docstring: bool = False, ignore: Set[str] = set()
+    delegatee: Callable, *, kwonly: bool = True, delegate_docstring: bool = False, ignore: AbstractSet[str] = _NO_IGNORE
 ) -> Callable:
     """
     A decorator function that adds the parameters of a delegatee function to a delegator function,
@@ -23,20 +163,26 @@ def delegate(
                         The default value is an empty set.
     :return: The decorator function that modifies the delegator function.
     """
-    # Retrieve the parameter information of delegatee and filter out the ignored parameters.
-    delegatee_params = list(inspect.signature(delegatee).parameters.values())
-    delegatee_params = [param for param in delegatee_params if param.name not in ignore]
-    # Keep only the positional or keyword parameters of delegatee.
-    delegatee_params = [
-        param for param in delegatee_params
-        if param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY, param.VAR_KEYWORD)
-    ]
-    # Convert the parameters of delegatee to keyword-only arguments if kwonly is True.
-    if kwonly:
-        delegatee_params = [
-            param.replace(kind=param.KEYWORD_ONLY) if param.kind == param.POSITIONAL_OR_KEYWORD else param
-            for param in delegatee_params
-        ]
+    # Retrieve the parameter information of delegatee in a single pass: skip the ignored parameters, keep only the
+    # positional or keyword parameters, and convert them to keyword-only arguments if kwonly is True.
+    delegatee_params = []
+    for name, param in _cached_signature(delegatee).parameters.items():
+        if param.kind not in _DELEGATED_KINDS or (ignore and name in ignore):
+            continue
+        if kwonly and param.kind is _POSITIONAL_OR_KEYWORD:
+            param = param.replace(kind=_KEYWORD_ONLY)
+        delegatee_params.append(param)
+    # The names of delegatee's parameters do not depend on the delegator, so compute them once.
+    delegatee_names = frozenset(param.name for param in delegatee_params)
+    # Positional parameters added to the delegator may follow one of its positional parameters with a default value, so
+    # the combined signature must still be validated in that case.
+    validate = any(param.kind is _POSITIONAL_OR_KEYWORD for param in delegatee_params)
+    # Partition delegatee's parameters up front, so that each decoration only has to partition the delegator's
+    # parameters. The buckets are shared by every decoration, so freeze them.
+    delegatee_buckets = tuple(tuple(bucket) for bucket in _partition(delegatee_params))
+    # Recorded on each delegator so that re-applying an equivalent decorator can be recognized. The classified
+    # parameters reflect kwonly and ignore as well as the delegatee's defaults and annotations at this point.
+    delegation = (delegatee, tuple(delegatee_params))
 
     def decorator(delegator: Callable) -> Callable:
         """
@@ -45,21 +191,34 @@ def delegate(
         :param delegator: The function to be modified.
         :return: The modified delegator function.
         """
+        # If delegator was already decorated with the same delegatee parameters and its signature has not been
+        # replaced since, the signature is already complete.
+        delegated_from = getattr(delegator, "_delegated_from", None)
+        if (
+            delegated_from is not None
+            and delegated_from[0] == delegation
+            and delegator.__dict__.get("__signature__") is delegated_from[1]
+        ):
+            if delegate_docstring:
+                delegator.__doc__ = delegatee.__doc__
+            return delegator
         # Retrieve the parameter information of delegator and filter out the VAR_KEYWORD parameter.
-        delegator_sig = inspect.signature(delegator)
-        delegator_params = [param for param in delegator_sig.parameters.values() if param.kind != param.VAR_KEYWORD]
-        # Combine the parameters of delegator and delegatee.
-        delegator_params = delegator_params + delegatee_params
+        delegator_sig = _signature(delegator)
+        delegator_params = [param for param in delegator_sig.parameters.values() if param.kind is not _VAR_KEYWORD]
         # Check for duplicate parameter names.
-        if len(delegator_params) != len(set(param.name for param in delegator_params)):
-            raise ValueError(f"Duplicate parameter names in {delegator_params}")
-        # Sort the combined parameters based on their type and whether they specify a default value.
-        new_delegator_params = sorted(
-            delegator_params, key=lambda param: (param.kind, param.default is not inspect.Parameter.empty)
-        )
-        # Create a new signature for the delegator function.
-        new_delegator_sig = delegator_sig.replace(parameters=new_delegator_params)
+        if not delegatee_names.isdisjoint(param.name for param in delegator_params):
+            raise ValueError(f"Duplicate parameter names in {delegator_params + delegatee_params}")
+        # Combine the parameters of delegator and delegatee, sorted based on their type and whether they specify a
+        # default value. Within each bucket, the delegator's parameters come before delegatee's.
+        buckets = _partition(delegator_params)
+        for bucket, delegatee_bucket in zip(buckets, delegatee_buckets):
+            bucket.extend(delegatee_bucket)
+        # Create a new signature for the delegator function, streaming the buckets into it in order. The names were
+        # checked for duplicates and only keyword parameters were added unless validate is True, so validation can
+        # usually be skipped.
+        new_delegator_sig = _replace_parameters(delegator_sig, chain.from_iterable(buckets), validate)
         delegator.__signature__ = new_delegator_sig  # type: ignore
+        delegator._delegated_from = delegation, new_delegator_sig  # type: ignore
         # Use the docstring of delegatee as the docstring of delegator if delegate_docstring is True.
         if delegate_docstring:
             delegator.__doc__ = delegatee.__doc__
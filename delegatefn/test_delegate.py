@@ -2,12 +2,15 @@
 Tests for the delegate decorator.
 """
 
+import functools
+import gc
 import inspect
+import weakref
 from typing import Callable, Set, NamedTuple, Optional, Type
 
 import pytest
 
-from delegatefn import delegate
+from delegatefn import delegate, _function_signature
 
 
 class TestCase(NamedTuple):
@@ -94,6 +97,25 @@ test_cases = [
         expected=lambda *, a, c: None,
         ignore={"b"},
     ),
+    TestCase(
+        description="Delegatee with no parameters to add.",
+        delegatee=lambda: None,
+        delegator=lambda a, *, b: None,
+        expected=lambda a, *, b: None,
+    ),
+    TestCase(
+        description="Delegatee with no parameters to add still sorts the parameters and removes **kwargs.",
+        delegatee=lambda: None,
+        delegator=lambda *, a=1, b, **kwargs: None,
+        expected=lambda *, b, a=1: None,
+    ),
+    TestCase(
+        description="Delegatee with all parameters ignored still removes **kwargs.",
+        delegatee=lambda a: None,
+        delegator=lambda b, **kwargs: None,
+        expected=lambda b: None,
+        ignore={"a"},
+    ),
 ]
 
 
@@ -118,9 +140,125 @@ def test_delegate(
 
             # Check that the decorated delegator function has the expected signature.
             assert inspect.signature(decorated_delegator) == inspect.signature(expected)
+            # Signature equality ignores the order of keyword-only parameters, so compare the rendered signatures too.
+            assert str(inspect.signature(decorated_delegator)) == str(inspect.signature(expected))
 
             # Check that the decorated delegator function has the expected docstring, if applicable.
             if delegate_docstring:
                 assert decorated_delegator.__doc__ == delegatee.__doc__
             else:
                 assert decorated_delegator.__doc__ == delegator.__doc__
+
+
+def test_delegate_stacked():
+    def first(a):
+        pass
+
+    def second(b):
+        pass
+
+    @delegate(second)
+    @delegate(first)
+    def delegator(x, **kwargs):
+        pass
+
+    assert inspect.signature(delegator) == inspect.signature(lambda x, *, a, b: None)
+
+
+def test_delegate_positional_order_validated():
+    def delegatee(b):
+        pass
+
+    def delegator(a=1, /):
+        pass
+
+    # Whether a positional parameter without a default may follow a positional-only one with a default depends on the
+    # Python version (it is rejected from 3.11), so delegate must agree with a validated Signature either way.
+    parameters = [*inspect.signature(delegator).parameters.values(), *inspect.signature(delegatee).parameters.values()]
+    try:
+        expected = inspect.Signature(parameters)
+    except ValueError:
+        with pytest.raises(ValueError, match="non-default argument follows default argument"):
+            delegate(delegatee, kwonly=False)(delegator)
+    else:
+        assert str(inspect.signature(delegate(delegatee, kwonly=False)(delegator))) == str(expected)
+
+
+def test_function_signature_matches_inspect():
+    def fn(a: int, b, /, c: "str" = "c", *args: int, d, e: float = 1.0, **kwargs: bool) -> None:
+        pass
+
+    def no_args():
+        pass
+
+    def var_kwargs_only(**kwargs):
+        pass
+
+    for f in (fn, no_args, var_kwargs_only, lambda x, *y: None):
+        assert _function_signature(f) == inspect.signature(f)
+        assert str(_function_signature(f)) == str(inspect.signature(f))
+
+
+def test_delegate_partialmethod_delegatee():
+    # Functions with attributes of their own, such as the unbound function of a partialmethod, use inspect.signature.
+    def method(self, a, b, c=1):
+        pass
+
+    class A:
+        pm = functools.partialmethod(method, 5)
+
+    decorated = delegate(A.pm, kwonly=False)(lambda x, **kwargs: None)
+    assert str(inspect.signature(decorated)) == "(x, self, b, c=1)"
+
+
+def test_delegate_reapplied():
+    def delegatee(a, b=1):
+        pass
+
+    def delegator(x, **kwargs):
+        pass
+
+    decorator = delegate(delegatee)
+    decorator(delegator)
+    delegate(delegatee)(decorator(delegator))
+    assert inspect.signature(delegator) == inspect.signature(lambda x, *, a, b=1: None)
+
+    # Re-applying with different options is not a no-op.
+    with pytest.raises(ValueError, match="Duplicate parameter names"):
+        delegate(delegatee, ignore={"b"})(delegator)
+
+    # Re-applying after the signature was replaced is not a no-op either.
+    delegator.__signature__ = inspect.signature(lambda x, **kwargs: None)
+    delegate(delegatee)(delegator)
+    assert inspect.signature(delegator) == inspect.signature(lambda x, *, a, b=1: None)
+
+    # Re-applying after the delegatee's parameters changed is not a no-op either.
+    delegatee.__defaults__ = (5,)
+    with pytest.raises(ValueError, match="Duplicate parameter names"):
+        delegate(delegatee)(delegator)
+
+
+def test_delegatee_changed_after_delegation():
+    def delegatee(a, b=1, *, c=1):
+        pass
+
+    delegate(delegatee)(lambda x: None)
+
+    delegatee.__defaults__ = (2,)
+    delegatee.__kwdefaults__["c"] = 2
+    delegatee.__annotations__["a"] = int
+    delegator = delegate(delegatee)(lambda x: None)
+    assert str(inspect.signature(delegator)) == "(x, *, a: int, b=2, c=2)"
+
+
+def test_self_referencing_delegatee_collected():
+    def delegatee(a, b=None):
+        pass
+
+    delegatee.__defaults__ = (delegatee,)
+    delegate(delegatee)(lambda x: None)
+
+    ref = weakref.ref(delegatee)
+    del delegatee
+    gc.collect()
+    assert ref() is None